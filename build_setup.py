@@ -24,11 +24,9 @@ On macOS, this script:
 import json
 import os
 import platform
-import re
 import shutil
 import sys
 import tempfile
-import urllib.request
 import typing
 from typing import Any, Union, Optional
 
@@ -37,6 +35,12 @@ import build_util.sh as sh
 import build_util.user as user
 
 
+SYSTEM = platform.system().lower()
+
+# Arguments that are treated as a request for the help text.
+HELP_ARGS = frozenset(("-h", "--help", "help", "/h", "/?", "h", "?"))
+
+
 def parse_args() -> None:
     """
     Parses command line arguments.
@@ -52,7 +56,7 @@ Usage:
     auto_confirm = None
 
     for arg in sys.argv[1:]:
-        if arg in ("-h", "--help", "help", "/h", "/?", "h", "?"):
+        if arg in HELP_ARGS:
             print(f"{USAGE}{HELP}")
             sys.exit(int(len(sys.argv) != 2))
 
@@ -73,27 +77,223 @@ Usage:
             log.fatal(f"Unknown argument `{arg}`." + USAGE)
 
 
-def create_cargo_config(contents: str) -> None:
+def __download_file(url: str, dest_path: str) -> None:
     """
-    Create a `.cargo/config.toml` file.
+    Downloads `url` to `dest_path`. When the server supports HTTP range
+    requests the file is fetched as several ranges in parallel (a single TCP
+    stream rarely saturates a fast link); otherwise it's streamed over one
+    connection. If `urllib3` (ideally with `certifi`) is installed, all
+    requests share one keep-alive connection pool so the range workers don't
+    pay a fresh TCP+TLS handshake each.
+
+    An interrupted single-stream download leaves `<dest_path>.part` behind
+    and is resumed with a range request on the next run, as long as the
+    server still reports the same size and `Last-Modified`.
     """
 
-    path = (
-        ".cargo\\config.toml"
-        if platform.system() == "Windows"
-        else ".cargo/config.toml"
-    )
+    # Deferred: urllib.request drags in ssl/http/email, which is a noticeable
+    # chunk of interpreter start-up, and most runs never download anything.
+    import urllib.request
+    from concurrent.futures import ThreadPoolExecutor
+
+    CHUNK_COUNT = 8
+    MIN_CHUNK_SIZE = 4 * 1024 * 1024
+    COPY_BUFFER_SIZE = 1024 * 1024
+
+    # `urllib3` and `certifi` are optional; the stdlib is the fallback.
+    pool = None
+    if url.startswith("http"):
+        try:
+            import urllib3
+
+            try:
+                import certifi
+
+                pool = urllib3.PoolManager(ca_certs=certifi.where(), retries=3)
+            except ImportError:
+                pool = urllib3.PoolManager(retries=3)
+        except ImportError:
+            pass
+
+    def request(
+        method: str, headers: Optional[dict[str, str]] = None
+    ) -> tuple[Optional[int], Any, Any]:
+        """
+        Returns `(status, response_headers, body)` where `body` is a readable,
+        closeable response object.
+        """
+
+        if pool is not None:
+            response = pool.request(
+                method, url, headers=headers, preload_content=False
+            )
+            return response.status, response.headers, response
+        response = urllib.request.urlopen(
+            urllib.request.Request(url, headers=headers or {}, method=method)
+        )
+        return response.status, response.headers, response
+
+    # Probe the total size and range support with a HEAD request.
+    try:
+        status, head_headers, body = request("HEAD")
+        body.close()
+        size = int(head_headers.get("Content-Length", "0"))
+        supports_ranges = (
+            head_headers.get("Accept-Ranges", "").lower() == "bytes"
+        )
+        last_modified = head_headers.get("Last-Modified", "")
+    except KeyboardInterrupt:
+        raise
+    except Exception:
+        size = 0
+        supports_ranges = False
+        last_modified = ""
+
+    # A sequential download streams into the `.part` file with a sidecar
+    # recording what the server looked like when it started, so a later run
+    # can tell whether the partial bytes are still valid to resume from.
+    part_path = f"{dest_path}.part"
+    meta_path = f"{dest_path}.part.meta"
+
+    def read_resume_offset() -> int:
+        """How many bytes of a previous attempt can be reused (0 if none)."""
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            part_size = os.stat(part_path).st_size
+        except (OSError, ValueError):
+            return 0
+        if (
+            not last_modified
+            or meta.get("last_modified") != last_modified
+            or meta.get("size") != size
+            or part_size > size
+        ):
+            return 0
+        return part_size
+
+    def finalize_partial() -> None:
+        os.replace(part_path, dest_path)
+        try:
+            os.remove(meta_path)
+        except OSError:
+            pass
+
+    def discard_partial() -> None:
+        for path in (part_path, meta_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def single_stream_download() -> None:
+        resume_from = read_resume_offset() if supports_ranges else 0
+        if size > 0 and resume_from == size:
+            finalize_partial()
+            return
+
+        headers = (
+            {"Range": f"bytes={resume_from}-"} if resume_from > 0 else None
+        )
+        status, _, body = request("GET", headers)
+        with body:
+            if status == 206:
+                mode = "ab"
+            elif status in (None, 200):
+                mode = "wb"  # The server restarted from the top.
+            else:
+                raise OSError(f"Download failed with HTTP status {status}.")
+
+            if last_modified and size > 0:
+                try:
+                    with open(meta_path, "w") as f:
+                        json.dump(
+                            {"last_modified": last_modified, "size": size}, f
+                        )
+                except OSError:
+                    pass
+
+            with open(part_path, mode) as f:
+                shutil.copyfileobj(body, f, length=COPY_BUFFER_SIZE)
+        finalize_partial()
+
+    if not supports_ranges or size < MIN_CHUNK_SIZE * 2:
+        single_stream_download()
+        return
+
+    if read_resume_offset() > 0:
+        # A previous attempt left a usable partial file; resuming it beats
+        # restarting from scratch in parallel.
+        single_stream_download()
+        return
+
+    chunk_size = max(MIN_CHUNK_SIZE, -(-size // CHUNK_COUNT))
+    ranges = [
+        (start, min(start + chunk_size, size) - 1)
+        for start in range(0, size, chunk_size)
+    ]
+
+    def fetch_range(start: int, end: int) -> None:
+        status, _, body = request("GET", {"Range": f"bytes={start}-{end}"})
+        with body:
+            if status != 206:
+                raise OSError("Server ignored the range request.")
+            with open(part_path, "r+b") as f:
+                f.seek(start)
+                shutil.copyfileobj(body, f, length=COPY_BUFFER_SIZE)
+
+    try:
+        # Pre-size the file so every worker can write straight to its offset.
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as workers:
+            futures = [
+                workers.submit(fetch_range, start, end)
+                for start, end in ranges
+            ]
+            for future in futures:
+                future.result()
+        finalize_partial()
+    except KeyboardInterrupt:
+        # A parallel partial is sparse (written at scattered offsets), so it
+        # can't be resumed by length; don't leave it around to be mistaken
+        # for one that can.
+        discard_partial()
+        raise
+    except Exception:
+        log.warning("Parallel download failed. Retrying as a single stream...")
+        discard_partial()
+        single_stream_download()
+
+
+def create_cargo_config(contents: str) -> bool:
+    """
+    Create a `.cargo/config.toml` file. Returns whether the file was written
+    (an existing file with identical contents is left untouched).
+    """
+
+    path = os.path.join(".cargo", "config.toml")
 
-    if os.path.exists(path) and not user.confirm(
-        f"A `{path}` file already exists. Overwrite?"
-    ):
-        log.fatal(f"Failed to create `{path}`.")
+    contents = "# Generated by `build_setup.py`.\n" + contents
+
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                if f.read() == contents:
+                    log.info(f"Cargo config already up to date (`{path}`).")
+                    return False
+        except OSError:
+            pass
+        if not user.confirm(f"A `{path}` file already exists. Overwrite?"):
+            log.fatal(f"Failed to create `{path}`.")
     else:
         os.makedirs(".cargo", exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
-        f.write("# Generated by `build_setup.py`.\n" + contents)
+        f.write(contents)
 
     log.info(f"Cargo config generated (`{path}`).")
+    return True
 
 
 def windows() -> None:
@@ -108,16 +308,89 @@ def windows() -> None:
 
     vs_installer_dir = win.vs_installer_dir()
     vs_installation_dir = win.vs_installation_dir()
+    vs_installer_path = os.path.join(vs_installer_dir, "vs_installer.exe")
+
+    # Where the exported Visual Studio component list is cached between runs
+    # (the export spawns the full VS installer engine and takes several
+    # seconds). The cache is keyed on the installation path plus the installer
+    # binary's mtime.
+    vs_components_cache_path = os.path.join(
+        os.environ.get("LOCALAPPDATA", tempfile.gettempdir()),
+        "bio-visualizer-vs-components.json",
+    )
+
+    def vs_components_cache_key() -> Optional[str]:
+        try:
+            installer_mtime = os.stat(vs_installer_path).st_mtime_ns
+        except OSError:
+            return None
+        return f"{vs_installation_dir}|{installer_mtime}"
+
+    # The installer keeps each instance's package manifest on disk at
+    # `%ProgramData%\Microsoft\VisualStudio\Packages\_Instances\<id>\state.json`.
+    # Reading that directly avoids spawning the (multi-second) installer
+    # engine just to export the same data.
+    def read_vs_components_from_state_json() -> Optional[list[str]]:
+        program_data = os.environ.get("ProgramData")
+        if program_data is None:
+            return None
+
+        instances_dir = os.path.join(
+            program_data, "Microsoft", "VisualStudio", "Packages", "_Instances"
+        )
+        try:
+            with os.scandir(instances_dir) as instances:
+                for instance in instances:
+                    try:
+                        with open(
+                            os.path.join(instance.path, "state.json"),
+                            encoding="utf-8-sig",
+                        ) as f:
+                            state = json.load(f)
+                    except (OSError, ValueError):
+                        continue
+
+                    if os.path.normcase(
+                        state.get("installationPath", "")
+                    ) != os.path.normcase(vs_installation_dir):
+                        continue
+
+                    components = [
+                        package["id"]
+                        for package in state.get("selectedPackages", [])
+                        if "id" in package
+                    ]
+                    if components:
+                        return components
+        except OSError:
+            pass
+        return None
 
     # Collect a list of all Visual Studio components that are installed.
     def get_installed_vs_components() -> list[str]:
+        components = read_vs_components_from_state_json()
+        if components is not None:
+            log.info("Read installed Visual Studio components directly.")
+            return components
+
+        cache_key = vs_components_cache_key()
+        if cache_key is not None:
+            try:
+                with open(vs_components_cache_path) as f:
+                    cached = json.load(f)
+                if cached["key"] == cache_key:
+                    log.info("Using cached Visual Studio component list.")
+                    return cached["components"]
+            except (OSError, ValueError, KeyError):
+                pass  # Missing/stale/corrupt cache; fall through to export.
+
         log.info("Exporting installed Visual Studio components...")
 
         # We'll use `vs_installer` to query installed components. The result
         # will be written to a JSON config file we can read.
 
-        temp_vs_installer_config_path = (
-            f"{tempfile.gettempdir()}\\config.vsconfig"
+        temp_vs_installer_config_path = os.path.join(
+            tempfile.gettempdir(), "config.vsconfig"
         )
 
         vs_installer_err_msg = (
@@ -127,7 +400,7 @@ def windows() -> None:
 
         try:
             sh.run_cmd(
-                f"{vs_installer_dir}\\vs_installer.exe",
+                vs_installer_path,
                 "--installPath",
                 vs_installation_dir,
                 "export",
@@ -147,22 +420,49 @@ def windows() -> None:
         except FileNotFoundError:
             log.fatal(vs_installer_err_msg)
 
+        if cache_key is not None:
+            try:
+                with open(vs_components_cache_path, "w") as f:
+                    json.dump(
+                        {"key": cache_key, "components": installed_components},
+                        f,
+                    )
+            except OSError:
+                pass  # The cache is just an optimization.
+
         log.info("Installed Visual Studio components exported.")
         return installed_components
 
     installed_vs_components = get_installed_vs_components()
 
-    # Ensures we have a required Visual Studio component installed.
+    # Every dotted prefix of every installed component id, so each component
+    # check below is a single set lookup instead of a regex scan over the
+    # whole component list.
+    installed_vs_component_prefixes: set[str] = set()
+    for installed_component in installed_vs_components:
+        parts = installed_component.split(".")
+        for i in range(1, len(parts) + 1):
+            installed_vs_component_prefixes.add(".".join(parts[:i]))
+
+    # Ensures we have a required Visual Studio component installed. A
+    # component counts as installed if its id is `component_id_prefix` or is
+    # nested under it (e.g. `...VC.Tools` matches `...VC.Tools.x86.x64`).
     def ensure_vs_component_is_installed(
-        component_name: str, component_regex: str
+        component_name: str, component_id_prefix: str
     ) -> None:
-        component_is_installed = any(
-            re.fullmatch(component_regex, installed_component) is not None
-            for installed_component in installed_vs_components
+        component_is_installed = (
+            component_id_prefix in installed_vs_component_prefixes
         )
 
         if not component_is_installed:
-            sh.start_cmd(f"{vs_installer_dir}\\vs_installer.exe")
+            # Drop the cached component list so that the rerun after the user
+            # installs the component re-exports instead of seeing stale data.
+            try:
+                os.remove(vs_components_cache_path)
+            except OSError:
+                pass
+
+            sh.start_cmd(vs_installer_path)
             log.fatal(
                 f"Missing the `{component_name}` component."
                 + " Please use the Visual Studio Installer to install it.\n"
@@ -176,26 +476,30 @@ def windows() -> None:
     # At a minimum, rust needs C++ build tools and a Windows 11 SDK.
     ensure_vs_component_is_installed(
         "C++ x64/x86 build tools (Latest)",
-        r"Microsoft\.VisualStudio\.Component\.VC\.Tools\..*",
+        "Microsoft.VisualStudio.Component.VC.Tools",
     )
     ensure_vs_component_is_installed(
         "Windows 11 SDK",
-        r"Microsoft\.VisualStudio\.Component\.Windows11SDK\..*",
+        "Microsoft.VisualStudio.Component.Windows11SDK",
     )
 
     # `ffmpeg-next` uses `bindgen` which requires `libclang` to generate rust
     # bindings. We get that from this component.
     ensure_vs_component_is_installed(
         "C++ Clang Compiler for Windows",
-        r"Microsoft\.VisualStudio\.Component\.VC\.Llvm\.Clang",
+        "Microsoft.VisualStudio.Component.VC.Llvm.Clang",
     )
 
     # Finds the `libclang` DLL.
     def get_libclang_path() -> str:
         # `libclang` needs to be installed for FFmpeg-next to be able to create
         # rust bindings.
-        libclang_path = f"{vs_installation_dir}\\VC\\Tools\\LLVM\\x64\\bin"
-        sh.ensure_path_exists(f"{libclang_path}\\libclang.dll", kind="file")
+        libclang_path = os.path.join(
+            vs_installation_dir, "VC", "Tools", "LLVM", "x64", "bin"
+        )
+        sh.ensure_path_exists(
+            os.path.join(libclang_path, "libclang.dll"), kind="file"
+        )
         log.info("Found `libclang`.")
 
         return libclang_path
@@ -204,21 +508,26 @@ def windows() -> None:
     # bindings for FFmpeg.
     def try_to_get_clang_include_dir() -> Optional[str]:
         try:
-            clang_dir = (
-                f"{vs_installation_dir}\\VC\\Tools\\LLVM\\x64\\lib\\clang"
+            clang_dir = os.path.join(
+                vs_installation_dir, "VC", "Tools", "LLVM", "x64", "lib",
+                "clang",
             )
 
-            newest_clang_version = sorted(
-                version
-                for version in os.listdir(clang_dir)
-                if os.path.isdir(os.path.join(clang_dir, version))
-            )[-1]
+            # `os.scandir` entries carry their type info, so no per-version
+            # stat is needed.
+            with os.scandir(clang_dir) as entries:
+                newest_clang_version = max(
+                    (entry.name for entry in entries if entry.is_dir()),
+                    key=sh.version_sort_key,
+                )
 
-            clang_include_dir = f"{clang_dir}\\{newest_clang_version}\\include"
+            clang_include_dir = os.path.join(
+                clang_dir, newest_clang_version, "include"
+            )
             sh.ensure_path_exists(clang_include_dir, kind="dir", non_fatal=True)
 
             log.info("Found Clang include directory.")
-        except (FileNotFoundError, IndexError, sh.DoesntExistException):
+        except (FileNotFoundError, ValueError, sh.DoesntExistException):
             log.warning(
                 "Failed to find Clang include directory. Compilation may fail."
             )
@@ -231,6 +540,11 @@ def windows() -> None:
         FFMPEG_ZIP_PATH = ".\\ffmpeg.7z"
         FFMPEG_DIR = ".\\ffmpeg"
 
+        # Resolved once up front; the relative forms above stay in the
+        # user-facing messages.
+        FFMPEG_ZIP_ABS_PATH = os.path.abspath(FFMPEG_ZIP_PATH)
+        FFMPEG_DIR_ABS_PATH = os.path.abspath(FFMPEG_DIR)
+
         def download_ffmpeg_zip() -> None:
             FFMPEG_DOWNLOAD_URL = "https://www.gyan.dev/ffmpeg/builds/packages/ffmpeg-8.0.1-full_build-shared.7z"
 
@@ -254,11 +568,11 @@ def windows() -> None:
             )
 
             try:
-                urllib.request.urlretrieve(FFMPEG_DOWNLOAD_URL, FFMPEG_ZIP_PATH)
+                __download_file(FFMPEG_DOWNLOAD_URL, FFMPEG_ZIP_PATH)
             except KeyboardInterrupt:
                 try:
                     os.remove(FFMPEG_ZIP_PATH)
-                except:
+                except OSError:
                     pass
                 log.warning(f"\nDownload cancelled. {MANUAL_INSTALL_MSG}")
                 raise
@@ -273,8 +587,8 @@ def windows() -> None:
             for cmd in (
                 "7z",
                 "7z.exe",
-                f"{win.program_files()}\\7-Zip\\7z.exe",
-                f"{win.program_files(x86=True)}\\7-Zip\\7z.exe",
+                os.path.join(win.program_files(), "7-Zip", "7z.exe"),
+                os.path.join(win.program_files(x86=True), "7-Zip", "7z.exe"),
             ):
                 try:
                     sh.ensure_cmd_exists(cmd, non_fatal=True)
@@ -291,7 +605,27 @@ def windows() -> None:
 
             return sevenzip_cmd
 
+        def try_extract_with_py7zr() -> bool:
+            # `py7zr` is optional; when it's installed the archive can be
+            # extracted in-process with no external tool or user action.
+            try:
+                import py7zr
+            except ImportError:
+                return False
+
+            log.info("Auto-extracting FFmpeg zip file with `py7zr`.")
+            try:
+                with py7zr.SevenZipFile(FFMPEG_ZIP_PATH, "r") as z:
+                    z.extractall(FFMPEG_DIR)
+            except Exception:
+                log.warning("Failed to extract with `py7zr`.")
+                return False
+            return True
+
         def extract_ffmpeg() -> None:
+            if try_extract_with_py7zr():
+                return
+
             if (sevenzip_cmd := get_7z_cmd()) is not None:
                 log.info("Auto-extracting FFmpeg zip file with 7z utility.")
                 try:
@@ -300,8 +634,10 @@ def windows() -> None:
                         "x",
                         FFMPEG_ZIP_PATH,
                         f"-o{FFMPEG_DIR}",
+                        non_fatal=True,
+                        capture=False,
                     )
-                except:
+                except sh.CmdException:
                     log.warning("Failed to extract with 7z utility.")
                 else:
                     return
@@ -315,7 +651,7 @@ def windows() -> None:
             sh.start_cmd(
                 "explorer",
                 "/select,",
-                f"{os.path.abspath(FFMPEG_ZIP_PATH)}",
+                FFMPEG_ZIP_ABS_PATH,
             )
             user.action_needed(
                 f"Please extract `{FFMPEG_ZIP_PATH}`" + f" to `{FFMPEG_DIR}`.",
@@ -328,7 +664,7 @@ def windows() -> None:
         def un_nest_ffmpeg_dir() -> None:
             try:
                 ffmpeg_dir_list = os.listdir(FFMPEG_DIR)
-            except:
+            except OSError:
                 log.fatal("Failed to check FFmpeg directory contents.")
 
             if len(ffmpeg_dir_list) != 1 or not user.confirm(
@@ -339,11 +675,16 @@ def windows() -> None:
                 return
 
             try:
-                tmp_location = tempfile.gettempdir()
-                shutil.move(FFMPEG_DIR, tmp_location)
-                shutil.move(f"{tmp_location}\\{ffmpeg_dir_list[0]}", FFMPEG_DIR)
+                # Two renames total, no matter how much the directory holds:
+                # the parent moves aside, the nested directory takes its
+                # place, and the empty shell is removed.
+                tmp_location = f"{FFMPEG_DIR}.tmp"
+                os.rename(FFMPEG_DIR, tmp_location)
+                os.rename(
+                    os.path.join(tmp_location, ffmpeg_dir_list[0]), FFMPEG_DIR
+                )
                 os.rmdir(tmp_location)
-            except:
+            except OSError:
                 log.warning("FFmpeg directory structure fix failed.")
                 if not user.confirm("Auto-fix failed. Continue anyway?"):
                     log.fatal("Not continuing.")
@@ -361,9 +702,9 @@ def windows() -> None:
         # `ffmpeg` directory (but we still ask first).
         un_nest_ffmpeg_dir()
 
-        sh.ensure_path_exists(f"{FFMPEG_DIR}\\include", kind="dir")
-        sh.ensure_path_exists(f"{FFMPEG_DIR}\\lib", kind="dir")
-        sh.ensure_path_exists(f"{FFMPEG_DIR}\\bin", kind="dir")
+        sh.ensure_path_exists(os.path.join(FFMPEG_DIR, "include"), kind="dir")
+        sh.ensure_path_exists(os.path.join(FFMPEG_DIR, "lib"), kind="dir")
+        sh.ensure_path_exists(os.path.join(FFMPEG_DIR, "bin"), kind="dir")
         log.info("FFmpeg found locally.")
 
         if os.path.exists(FFMPEG_ZIP_PATH) and user.confirm(
@@ -372,11 +713,23 @@ def windows() -> None:
         ):
             os.remove(FFMPEG_ZIP_PATH)
 
-        return os.path.abspath(FFMPEG_DIR)
+        return FFMPEG_DIR_ABS_PATH
+
+    # `get_libclang_path` can `log.fatal`, so it runs up front on the main
+    # thread - from a worker its failure would only surface after the FFmpeg
+    # step, interleaving with the prompt mid-download on an already-doomed
+    # run. The clang include probe never exits (it just warns), so that one
+    # overlaps with the FFmpeg step, which may prompt the user and spend
+    # seconds downloading on the main thread in the meantime.
+    from concurrent.futures import ThreadPoolExecutor
 
     libclang_path = get_libclang_path()
-    clang_include_dir = try_to_get_clang_include_dir()
-    ffmpeg_dir = get_ffmpeg_dir()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        clang_include_dir_future = pool.submit(try_to_get_clang_include_dir)
+        ffmpeg_dir = get_ffmpeg_dir()
+
+    clang_include_dir = clang_include_dir_future.result()
 
     def to_unix_path(path: str) -> str:
         return path.replace("\\", "/")
@@ -402,10 +755,13 @@ def windows() -> None:
             + f'"-I{to_unix_path(clang_include_dir)}"\n'
         )
 
-    create_cargo_config(cargo_config)
-
-    sh.run_cmd("cargo", "clean")
-    log.info("Build directory cleaned.")
+    # A stale build directory only matters when the config (and with it the
+    # FFmpeg build environment) actually changed.
+    if create_cargo_config(cargo_config):
+        sh.run_cmd("cargo", "clean", capture=False)
+        log.info("Build directory cleaned.")
+    else:
+        log.info("Cargo config unchanged; skipping `cargo clean`.")
 
 
 def mac_os() -> None:
@@ -438,9 +794,7 @@ def mac_os() -> None:
 
     last_installed_pkgs: Optional[list[dict[str, Any]]] = None
 
-    def is_installed_with_brew(
-        pkg_name: str, ask_to_install: bool = False
-    ) -> bool:
+    def installed_pkgs() -> list[dict[str, Any]]:
         nonlocal last_installed_pkgs
         if last_installed_pkgs is None:
             last_installed_pkgs = typing.cast(
@@ -455,27 +809,35 @@ def mac_os() -> None:
                     )
                 ),
             )
-        installed_pkgs = last_installed_pkgs
-
-        def names_from_pkg_dict(pkg_dict: dict[str, Any]) -> list[str]:
-            ret: list[str] = []
-            for key in ("name", "full_name", "oldnames", "aliases"):
-                val = pkg_dict.get(key)
-                if isinstance(val, str):
-                    ret.append(val)
-                elif isinstance(val, list):
-                    ret.extend(
-                        sub_val
-                        for sub_val in typing.cast(list[Union[str, Any]], val)
-                        if isinstance(sub_val, str)
-                    )
-            return ret
-
-        is_already_installed = any(
+        return last_installed_pkgs
+
+    def names_from_pkg_dict(pkg_dict: dict[str, Any]) -> list[str]:
+        ret: list[str] = []
+        for key in ("name", "full_name", "oldnames", "aliases"):
+            val = pkg_dict.get(key)
+            if isinstance(val, str):
+                ret.append(val)
+            elif isinstance(val, list):
+                ret.extend(
+                    sub_val
+                    for sub_val in typing.cast(list[Union[str, Any]], val)
+                    if isinstance(sub_val, str)
+                )
+        return ret
+
+    def pkg_is_installed(pkg_name: str) -> bool:
+        return any(
             pkg_name in names_from_pkg_dict(pkg_dict)
-            for pkg_dict in installed_pkgs
+            for pkg_dict in installed_pkgs()
         )
 
+    def is_installed_with_brew(
+        pkg_name: str, ask_to_install: bool = False
+    ) -> bool:
+        nonlocal last_installed_pkgs
+
+        is_already_installed = pkg_is_installed(pkg_name)
+
         if is_already_installed or not ask_to_install:
             return is_already_installed
 
@@ -492,13 +854,15 @@ def mac_os() -> None:
         last_installed_pkgs = None
 
         try:
-            sh.run_cmd("brew", "install", pkg_name, non_fatal=True)
+            sh.run_cmd(
+                "brew", "install", pkg_name, non_fatal=True, capture=False
+            )
 
         # Sometimes Homebrew likes to return an error exit code even when it
         # installs correctly. If that happens we'll just log it and move on with
         # our lives.
         except sh.CmdException as e:
-            if not is_installed_with_brew(pkg_name):  # recursion!
+            if not pkg_is_installed(pkg_name):
                 log.fatal(f"{e}")
             log.warning(f"{e} `{pkg_name}` seems to have installed regardless.")
 
@@ -510,8 +874,10 @@ def mac_os() -> None:
     if not is_installed_with_brew("pkg-config", ask_to_install=True):
         log.warning("Continuing without installing `pkg-config`.")
 
-    sh.run_cmd("cargo", "clean")
-    log.info("Build directory cleaned.")
+    # No `cargo clean` here: unlike Windows, setup on macOS doesn't write a
+    # `.cargo/config.toml` (FFmpeg is found through `pkg-config` at build
+    # time), so there's no stale configuration for a clean to flush and it
+    # would only throw away the incremental build cache.
 
 
 def main() -> None:
@@ -521,15 +887,14 @@ def main() -> None:
 
     sh.ensure_cmd_exists("cargo")
 
-    system = platform.system().lower()
-    if system == "windows":
+    if SYSTEM == "windows":
         windows()
-    elif system == "darwin":  # macOS
+    elif SYSTEM == "darwin":  # macOS
         mac_os()
-    elif system == "linux":
+    elif SYSTEM == "linux":
         log.fatal("unimplemented")
     else:
-        log.fatal(f"Unsupported system: `{system}`")
+        log.fatal(f"Unsupported system: `{SYSTEM}`")
 
     log.success("Build setup complete.")
 
@@ -20,6 +20,24 @@ class Color:
     RESET = "\033[0m" if ENABLED else ""
 
 
+# Each log call prints one of these; building them once at import avoids
+# re-concatenating the color codes on every line.
+__FATAL_PREFIX = f"{Color.ERROR}FATAL{Color.RESET}: "
+__WARNING_PREFIX = f"{Color.WARNING}WARNING{Color.RESET}: "
+__ERROR_PREFIX = f"{Color.ERROR}ERROR{Color.RESET}: "
+__INFO_PREFIX = f"{Color.INFO}INFO{Color.RESET}: "
+__SUCCESS_PREFIX = f"{Color.SUCCESS}SUCCESS{Color.RESET}: "
+
+
+def __join_args(args: tuple[Any, ...], sep: Optional[str]) -> str:
+    """
+    Joins log arguments the way `print(*args, sep=sep)` would, so each log
+    call can emit its prefix and message in a single write.
+    """
+
+    return (" " if sep is None else sep).join(map(str, args))
+
+
 def fatal(
     *args: Any,
     include_run_again_msg: bool = True,
@@ -31,8 +49,7 @@ def fatal(
 
     sys.stdout.flush()
 
-    print(f"{Color.ERROR}FATAL{Color.RESET}: ", end="", file=sys.stderr)
-    print(*args, sep=sep, file=sys.stderr)
+    print(__FATAL_PREFIX + __join_args(args, sep), file=sys.stderr)
     if include_run_again_msg:
         print(
             "\nPlease run this script again once the issue is resolved.",
@@ -54,12 +71,11 @@ def warning(
     """
 
     print(
-        f"{Color.WARNING}WARNING{Color.RESET}: ",
-        end="",
+        __WARNING_PREFIX + __join_args(args, sep),
         file=sys.stderr,
-        flush=False,
+        end=end,
+        flush=flush,
     )
-    print(*args, sep=sep, file=sys.stderr, end=end, flush=flush)
 
 
 def error(
@@ -73,12 +89,11 @@ def error(
     """
 
     print(
-        f"{Color.ERROR}ERROR{Color.RESET}: ",
-        end="",
+        __ERROR_PREFIX + __join_args(args, sep),
         file=sys.stderr,
-        flush=False,
+        end=end,
+        flush=flush,
     )
-    print(*args, sep=sep, file=sys.stderr, end=end, flush=flush)
 
 
 def info(
@@ -91,8 +106,7 @@ def info(
     Print some info.
     """
 
-    print(f"{Color.INFO}INFO{Color.RESET}: ", end="", flush=False)
-    print(*args, sep=sep, end=end, flush=flush)
+    print(__INFO_PREFIX + __join_args(args, sep), end=end, flush=flush)
 
 
 def success(
@@ -105,5 +119,4 @@ def success(
     Print that the process is done (success).
     """
 
-    print(f"{Color.SUCCESS}SUCCESS{Color.RESET}: ", end="", flush=False)
-    print(*args, sep=sep, end=end, flush=flush)
+    print(__SUCCESS_PREFIX + __join_args(args, sep), end=end, flush=flush)
@@ -30,14 +30,14 @@ def vs_installer_dir() -> str:
     The path that the Visual Studio Installer is in. The result is cached.
     """
 
-    path_suffix = "\\Microsoft Visual Studio\\Installer"
+    path_suffix = os.path.join("Microsoft Visual Studio", "Installer")
 
     # We'll check both program files folders.
     try:
-        ret = program_files(x86=True) + path_suffix
+        ret = os.path.join(program_files(x86=True), path_suffix)
         sh.ensure_path_exists(ret, kind="dir", non_fatal=True)
     except sh.DoesntExistException:
-        ret = program_files() + path_suffix
+        ret = os.path.join(program_files(), path_suffix)
         sh.ensure_path_exists(
             ret,
             kind="dir",
@@ -50,16 +50,27 @@ def vs_installer_dir() -> str:
     return ret
 
 
+@cache
+def vswhere_exe() -> str:
+    """
+    The path of the Visual Studio Installer's `vswhere.exe`, validated to
+    exist. The result is cached.
+    """
+
+    ret = os.path.join(vs_installer_dir(), "vswhere.exe")
+    sh.ensure_path_exists(ret, kind="file")
+    return ret
+
+
 @cache
 def vs_installation_dir() -> str:
     """
     The path of a Visual Studio installation. The result is cached.
     """
 
-    sh.ensure_path_exists(f"{vs_installer_dir()}\\vswhere.exe", kind="file")
     try:
         ret = sh.run_cmd(
-            f"{vs_installer_dir()}\\vswhere.exe",
+            vswhere_exe(),
             "-property",
             "installationPath",
             "-version",
@@ -80,18 +91,21 @@ def vs_msvc_tools_dir() -> str:
     The path of a Visual Studio installation's MSVC tools. The result is cached.
     """
 
-    sh.ensure_path_exists(f"{vs_installer_dir()}\\vswhere.exe", kind="file")
     try:
-        versions_dir = f"{vs_installation_dir()}\\VC\\Tools\\MSVC"
-        newest_version = sorted(
-            version
-            for version in os.listdir(versions_dir)
-            if os.path.isdir(os.path.join(versions_dir, version))
-        )[-1]
-        ret = f"{versions_dir}\\{newest_version}\\bin\\Hostx64\\x64"
+        versions_dir = os.path.join(
+            vs_installation_dir(), "VC", "Tools", "MSVC"
+        )
+        with os.scandir(versions_dir) as entries:
+            newest_version = max(
+                (entry.name for entry in entries if entry.is_dir()),
+                key=sh.version_sort_key,
+            )
+        ret = os.path.join(
+            versions_dir, newest_version, "bin", "Hostx64", "x64"
+        )
 
         sh.ensure_path_exists(ret, kind="dir")
-    except (sh.CmdException, IndexError, sh.DoesntExistException):
+    except (sh.CmdException, ValueError, sh.DoesntExistException):
         log.fatal("Couldn't find Visual Studio's MSVC tools.")
 
     log.info("Visual Studio's MSVC Tools found.")
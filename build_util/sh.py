@@ -2,14 +2,19 @@
 Contains shell and OS utilities.
 """
 
+import codecs
 import os
 import platform
 import re
+import shlex
+import stat
 import string
 import sys
 import shutil
 import subprocess
+import tempfile
 import typing
+from functools import cache
 from pathlib import Path
 from typing import Literal, Iterable, Sequence, Optional, Callable
 
@@ -17,10 +22,11 @@ from . import log
 from .log import Color
 
 
+@cache
 def get_supported_arch() -> Optional[Literal["x86_64", "arm64"]]:
     """
     Returns `"x86_64"`, `"arm64"`, or `None` depending on the architecture of
-    the current machine.
+    the current machine. The result is cached.
     """
 
     return typing.cast(
@@ -33,6 +39,16 @@ def get_supported_arch() -> Optional[Literal["x86_64", "arm64"]]:
     )
 
 
+def version_sort_key(version: str) -> tuple[int, ...]:
+    """
+    Key for comparing dotted version strings numerically (where plain string
+    comparison would put `"9.0"` after `"10.0"`). Non-numeric parts are
+    skipped.
+    """
+
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+
 def rm_path(
     path: str,
     allow_missing: bool = False,
@@ -44,7 +60,13 @@ def rm_path(
     not is returned.
     """
 
-    if not os.path.exists(path):
+    # A single `stat` tells us both whether the path exists and what it is.
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        mode = None
+
+    if mode is None:
         if allow_missing:
             return False
 
@@ -56,11 +78,11 @@ def rm_path(
         log.fatal(err_msg)
 
     try:
-        if os.path.isdir(path):
+        if stat.S_ISDIR(mode):
             shutil.rmtree(path)
-        elif os.path.exists(path):
+        else:
             os.remove(path)
-    except:
+    except OSError:
         err_msg = f"Failed to remove `{path}`." + (
             f"\n{help_msg}" if help_msg is not None else ""
         )
@@ -71,6 +93,16 @@ def rm_path(
     return True
 
 
+# Maps an `ensure_path_exists` kind onto its `st_mode` predicate and how that
+# kind reads in error messages.
+__PATH_KIND_CHECKS: dict[str, tuple[Callable[[int], bool], str]] = {
+    "file": (stat.S_ISREG, "file"),
+    "dir": (stat.S_ISDIR, "directory"),
+    "any": (lambda mode: True, "anything"),
+}
+
+
+@cache
 def ensure_path_exists(
     path: str,
     kind: Literal["file", "dir", "any"] = "any",
@@ -78,20 +110,19 @@ def ensure_path_exists(
     non_fatal: bool = False,
 ) -> None:
     """
-    Does a check to see if a path exists.
+    Does a check to see if a path exists. Successful checks are cached so that
+    repeat probes of the same path don't re-stat it (failed checks exit or
+    raise and so are never cached).
     """
 
-    if kind == "file":
-        check_exists = os.path.isfile
-        kind_str = "file"
-    elif kind == "dir":
-        check_exists = os.path.isdir
-        kind_str = "directory"
-    elif kind == "any":
-        check_exists = os.path.exists
-        kind_str = "anything"
+    # A single `stat` tells us both whether the path exists and what it is.
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        mode = None
 
-    if check_exists(path):
+    kind_check, kind_str = __PATH_KIND_CHECKS[kind]
+    if mode is not None and kind_check(mode):
         return
 
     err_msg = f"Couldn't find {kind_str} at `{path}`." + (
@@ -102,6 +133,33 @@ def ensure_path_exists(
     log.fatal(err_msg)
 
 
+def copy_file(src: str, dest: str) -> None:
+    """
+    Copies a file (and its permission bits) to a destination file path. On
+    platforms with `os.copy_file_range` the bytes are moved entirely in the
+    kernel (which can also reflink on supporting filesystems) instead of
+    bouncing through userspace buffers.
+    """
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as src_f, open(dest, "wb") as dest_f:
+                remaining = os.fstat(src_f.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        src_f.fileno(), dest_f.fileno(), remaining
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copymode(src, dest)
+            return
+        except OSError:
+            pass  # e.g. an unsupported filesystem; use the generic copy.
+
+    shutil.copy(src, dest)
+
+
 def copy_files_dir_to_dir(
     src_dir: str, dest_dir: str, file_ext_filter: Optional[str] = None
 ) -> list[str]:
@@ -121,28 +179,54 @@ def copy_files_dir_to_dir(
 
     copied: list[str] = []
     try:
-        for file_name in os.listdir(src_dir):
-            file_path = f"{src_dir}/{file_name}"
-
-            if not os.path.isfile(file_path) or (
-                file_ext_filter is not None
-                and not file_name.endswith(file_ext_filter)
-            ):
-                continue
-
-            dest_path = f"{dest_dir}/{file_name}"
-            shutil.copy(file_path, dest_path)
-            copied.append(os.path.abspath(dest_path))
-    except:
-        log.fatal("Failed top copy files from one directory to another.")
+        # `os.scandir` already knows each entry's type, so no per-file stat is
+        # needed, and `copy_file` copies kernel-side where supported.
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                if not entry.is_file() or (
+                    file_ext_filter is not None
+                    and not entry.name.endswith(file_ext_filter)
+                ):
+                    continue
+
+                dest_path = f"{dest_dir}/{entry.name}"
+                copy_file(entry.path, dest_path)
+                copied.append(os.path.abspath(dest_path))
+    except OSError:
+        log.fatal("Failed to copy files from one directory to another.")
     return copied
 
 
+def make_temp_dir() -> str:
+    """
+    Creates a temporary directory and returns its path. RAM-backed storage
+    (`/dev/shm` on Linux) is preferred when available so that short-lived
+    intermediate files never hit the disk. The location can be overridden with
+    the `BUILD_PKG_TMPDIR` environment variable.
+    """
+
+    override = os.environ.get("BUILD_PKG_TMPDIR")
+    if override:
+        return tempfile.mkdtemp(dir=override)
+
+    if os.path.isdir("/dev/shm"):
+        try:
+            return tempfile.mkdtemp(dir="/dev/shm")
+        except OSError:
+            pass  # Fall back to the default temp location.
+
+    return tempfile.mkdtemp()
+
+
+@cache
 def ensure_cmd_exists(
     cmd: str, help_msg: Optional[str] = None, non_fatal: bool = False
 ) -> None:
     """
     Does a check to see if a command exists on the `PATH` or the file system.
+    Successful checks are cached so that repeat probes of the same command
+    don't rescan the `PATH` (failed checks exit or raise and so are never
+    cached).
     """
 
     if shutil.which(cmd) is not None or os.path.exists(cmd):
@@ -161,12 +245,14 @@ def run_cmd(
     shell: bool = False,
     non_fatal: bool = False,
     show_output: bool = True,
+    capture: bool = True,
     env_overrides: Optional[dict[str, str]] = None,
 ) -> str:
     """
     Runs a shell command and returns its output (minus a trailing newline if it
     has one). All CRLF newlines are replaced with LF newlines in the returned
-    output.
+    output. Callers that ignore the output can pass `capture=False` to skip
+    accumulating it (an empty string is returned).
     """
 
     __print_running_cmd(cmd, env_overrides)
@@ -181,24 +267,52 @@ def run_cmd(
         for k, v in env_overrides.items():
             env[k] = v
 
-        process = subprocess.Popen(
-            cmd if not shell else " ".join(cmd),
-            shell=shell,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,  # Combine stderr and stdout to stdout.
-            text=False,
-            env=env,
-        )
-
-        # Capture lines as they come in.
-        output = ""
-        if process.stdout is not None:
-            for line in process.stdout:
-                line = line.decode("utf-8", errors="replace")
-                output += line
-                if show_output:
-                    print(line, end="", flush=True)
-        process.wait()
+        if not show_output:
+            # Nothing to echo, so let `subprocess.run` slurp the pipe with
+            # its C-level reader instead of looping over blocks in Python
+            # (or drop the output in the kernel if nobody wants it).
+            completed = subprocess.run(
+                cmd if not shell else " ".join(cmd),
+                shell=shell,
+                stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+                stderr=subprocess.STDOUT,
+                env=env,
+                # Closing inherited handles costs a scan of the whole handle
+                # table on Windows and isn't needed with wired std streams.
+                close_fds=os.name != "nt",
+            )
+            exit_code = completed.returncode
+            output = (
+                completed.stdout.decode("utf-8", errors="replace")
+                if capture
+                else ""
+            )
+        else:
+            process = subprocess.Popen(
+                cmd if not shell else " ".join(cmd),
+                shell=shell,
+                stdout=subprocess.PIPE,
+                # Combine stderr and stdout to stdout.
+                stderr=subprocess.STDOUT,
+                text=False,
+                env=env,
+                close_fds=os.name != "nt",
+            )
+
+            # Drain the pipe in large binary blocks (iterating lines would
+            # run Python-level line splitting and a decode for every line of
+            # output).
+            chunks: list[bytes] = []
+            if process.stdout is not None:
+                decoder = codecs.getincrementaldecoder("utf-8")("replace")
+                while block := process.stdout.read1(65536):
+                    if capture:
+                        chunks.append(block)
+                    print(decoder.decode(block), end="", flush=True)
+            process.wait()
+
+            exit_code = process.returncode
+            output = b"".join(chunks).decode("utf-8", errors="replace")
 
     except KeyboardInterrupt:
         raise
@@ -210,7 +324,7 @@ def run_cmd(
         if show_output:
             print(f"\n{Color.RESET + Color.COMMAND}{'~' * 80}{Color.RESET}")
 
-    if (exit_code := process.returncode) != 0:
+    if exit_code != 0:
         err_msg = (
             f"`{__format_cmd(cmd, env_overrides)}` "
             + f"failed with exit code {exit_code}."
@@ -231,7 +345,11 @@ def start_cmd(*cmd: str, shell: bool = False) -> None:
     """
 
     __print_running_cmd(cmd, None)
-    subprocess.Popen(cmd if not shell else " ".join(cmd), shell=shell)
+    subprocess.Popen(
+        cmd if not shell else " ".join(cmd),
+        shell=shell,
+        close_fds=os.name != "nt",
+    )
 
 
 def require_script_in_working_dir() -> None:
@@ -243,7 +361,7 @@ def require_script_in_working_dir() -> None:
     try:
         script_dir = str(Path(os.path.realpath(sys.argv[0])).parent)
         working_dir = os.path.realpath(os.getcwd())
-    except:
+    except OSError:
         log.fatal("Failed to compare script directory with working directory.")
 
     if script_dir != working_dir:
@@ -294,7 +412,7 @@ def compile_template_file(
     try:
         with open(src_file, "r") as f:
             src_str = f.read()
-    except:
+    except OSError:
         log.fatal(f"Failed to read `{src_file}`.")
 
     unused_keys = set(key_values.keys())
@@ -327,7 +445,7 @@ def compile_template_file(
         try:
             with open(dest_file, "w") as f:
                 f.write(dest_str)
-        except:
+        except OSError:
             log.fatal(f"Failed to write to `{dest_file}`.")
 
     return dest_str
@@ -338,12 +456,15 @@ def __format_cmd(
     env_overrides: Optional[dict[str, str]],
 ) -> str:
     """
-    Joins the command arguments into a single string, naively wrapping arguments
-    that contain spaces in double quotes.
+    Joins the command arguments into a single string, quoting arguments the way
+    a POSIX shell would. Arguments that already contain color escape codes keep
+    the old naive quoting so it doesn't mangle the highlighting.
     """
 
     def clean_arg(arg: str) -> str:
-        return f'"{arg}"' if " " in arg else arg
+        if "\033" in arg:
+            return f'"{arg}"' if " " in arg else arg
+        return shlex.quote(arg)
 
     joined_cmd = " ".join(clean_arg(arg) for arg in cmd)
 
@@ -2,6 +2,7 @@
 Contains utilities for getting user input.
 """
 
+import sys
 from typing import Any, Optional
 
 from . import sh
@@ -11,6 +12,16 @@ from .log import Color
 __confirm_auto_answer = None
 
 
+def __write_prompt(message: str) -> None:
+    """
+    Emits a prompt as one write + one flush instead of a handful of separate
+    `print` calls.
+    """
+
+    sys.stdout.write(message)
+    sys.stdout.flush()
+
+
 def set_confirm_auto_answer(auto_answer: Optional[str]) -> None:
     """
     When set to a value other than `None`, `confirm()` will be replied to
@@ -26,9 +37,11 @@ def confirm(*args: Any, sep: Optional[str] = " ") -> bool:
     Log a message and await a "yes"/"no" from the user.
     """
 
-    print(f"{Color.CONFIRM}CONFIRM{Color.RESET}: ", end="")
-    print(*args, sep=sep, end="")
-    print(f" ({Color.CONFIRM}y{Color.RESET}/n): {Color.CONFIRM}", end="")
+    __write_prompt(
+        f"{Color.CONFIRM}CONFIRM{Color.RESET}: "
+        + (" " if sep is None else sep).join(map(str, args))
+        + f" ({Color.CONFIRM}y{Color.RESET}/n): {Color.CONFIRM}"
+    )
 
     if __confirm_auto_answer is None:
         try:
@@ -51,13 +64,12 @@ def action_needed(*args: Any, sep: Optional[str] = " ") -> None:
     optionally run a command.
     """
 
-    print(f"{Color.ACTION_NEEDED}MANUAL ACTION NEEDED{Color.RESET}: ", end="")
-    print(*args, sep=sep, end="")
-    print(
-        f" (press [{Color.ACTION_NEEDED}ENTER{Color.RESET}] if you have "
+    __write_prompt(
+        f"{Color.ACTION_NEEDED}MANUAL ACTION NEEDED{Color.RESET}: "
+        + (" " if sep is None else sep).join(map(str, args))
+        + f" (press [{Color.ACTION_NEEDED}ENTER{Color.RESET}] if you have "
         + "completed the action manually or enter a shell command to run): "
-        + f"{Color.ACTION_NEEDED}",
-        end="",
+        + f"{Color.ACTION_NEEDED}"
     )
 
     output_is_terminal = Color.RESET != ""